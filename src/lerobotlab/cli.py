@@ -10,9 +10,15 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson is an optional speedup, stdlib json is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import __version__
 from .download import download_datasets, validate_download_path
-from .convert import convert_datasets, validate_output_path, validate_input_path, validate_format
+from .convert import convert_datasets, validate_output_path, validate_input_path, validate_format, validate_conversion_options, default_jobs
 
 
 def validate_selection_json(json_path: str) -> Dict[str, Any]:
@@ -35,8 +41,8 @@ def validate_selection_json(json_path: str) -> Dict[str, Any]:
         sys.exit(1)
     
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        raw = json_file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in '{json_path}': {e}")
         sys.exit(1)
@@ -136,6 +142,7 @@ def handle_convert(args):
         validate_output_path(args.output_path)
         validate_input_path(args.input_path)
         format_validated = validate_format(args.format)
+        validate_conversion_options(format_validated, args.quantize, args.compression)
         
         # Display summary
         print(f"=== Convert Command ({format_validated.upper()}) ===")
@@ -143,7 +150,7 @@ def handle_convert(args):
             display_selection_summary(data)
                            
         # Execute conversion
-        convert_datasets(data, args.output_path, args.input_path, format_validated, args.verbose)
+        convert_datasets(data, args.output_path, args.input_path, format_validated, args.verbose, args.jobs, args.quantize, args.compression)
         
     except Exception as e:
         print(f"Error: Unexpected error: {e}", file=sys.stderr)
@@ -207,10 +214,28 @@ def main():
     )
     convert_parser.add_argument(
         '--format',
-        choices=['vjepa2-ac'],
+        choices=['vjepa2-ac', 'vjepa2-ac-zarr', 'droid-parquet'],
         required=True,
         help='Output format for converted datasets'
     )
+    convert_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=default_jobs(),
+        help='Number of datasets to convert in parallel (default: min(4, CPU count))'
+    )
+    convert_parser.add_argument(
+        '--quantize',
+        choices=['none', 'bf16', 'int8'],
+        default='none',
+        help='Store state/action arrays quantized to bfloat16 or 8-bit (V-JEPA2-AC formats only)'
+    )
+    convert_parser.add_argument(
+        '--compression',
+        choices=['none', 'blosc-lz4'],
+        default='none',
+        help='Compress trajectory.h5 with Blosc+LZ4; readers then need hdf5plugin (vjepa2-ac only)'
+    )
     convert_parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -221,6 +246,9 @@ def main():
     # Parse arguments and call appropriate handler
     args = parser.parse_args()
     
+    if getattr(args, 'jobs', 1) < 1:
+        parser.error('--jobs must be at least 1')
+    
     if not hasattr(args, 'func'):
         parser.print_help()
         sys.exit(1)
@@ -4,28 +4,73 @@ LeRobotLab Tools - Convert Module
 Handles conversion of robot datasets to V-JEPA2-AC format.
 """
 
+import functools
+import json
+import logging
 import os
+import stat
 import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 
 from .droid_conversion import DROIDConverter
 from .vjepa2_ac_conversion import VJEPA2ACConverter
 
 
+log = logging.getLogger("lerobotlab.convert")
+
+# Shared read-only stand-in for a selection without metadata
+_EMPTY = types.MappingProxyType({})
+
+_SUPPORTED_FORMATS = frozenset(('droid', 'vjepa2-ac', 'droid-parquet', 'vjepa2-ac-zarr'))
+
+# Formats that write HDF5 and accept the compression option
+_HDF5_FORMATS = frozenset(('vjepa2-ac',))
+
+# Formats whose converters accept the quantize option
+_QUANTIZABLE_FORMATS = frozenset(('vjepa2-ac', 'vjepa2-ac-zarr'))
+
+# Formats that do a real conversion, the only ones worth profiling
+_PROFILED_FORMATS = _SUPPORTED_FORMATS - {'droid'}
+
+# Measured conversion rates (frames per second per worker) per format, refined after every full run
+PROFILE_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "lerobotlab" / "profile.json"
+)
+
+# Per-worker rate assumed for a format that has not been profiled yet
+DEFAULT_FPS = 1000.0
+
+# Runs shorter than this are dominated by worker startup and are not profiled
+PROFILE_MIN_SECONDS = 10.0
+
+# Weight of the latest run when blending it into the stored rate
+PROFILE_SMOOTHING = 0.3
+
+_PROFILED_FPS: Optional[Dict[str, float]] = None
+
+
 def convert_datasets(
     selection_data: Dict[str, Any],
     output_path: str,
     input_path: str,
     format: str,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: Optional[int] = None,
+    quantize: str = 'none',
+    compression: str = 'none'
 ) -> None:
+    _configure_logging(verbose)
     try:
         output_dir = Path(output_path)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        if verbose:
-            print(f"Created output directory: {output_dir.absolute()}")
+        # Resolved once for log lines; converters keep the paths as given
+        output_abs = output_dir.absolute()
+        log.info("Created output directory: %s", output_abs)
 
         input_dir = Path(input_path)
         if not input_dir.exists():
@@ -33,43 +78,210 @@ def convert_datasets(
             sys.exit(1)
  
         datasets = selection_data.get('datasets', [])
+        metadata = selection_data.get('metadata') or _EMPTY
+        if jobs is None:
+            jobs = default_jobs()
+        jobs = max(1, min(jobs, len(datasets)))
         
-        if verbose:
-            metadata = selection_data.get('metadata', {})
-            print(f"Converting {len(datasets)} datasets to {format.upper()} format...")
-            if 'total_episodes' in metadata:
-                print(f"Total episodes to convert: {metadata['total_episodes']}")
+        log.info("Converting %d datasets to %s format...", len(datasets), format.upper())
+        if 'total_episodes' in metadata:
+            log.info("Total episodes to convert: %s", metadata['total_episodes'])
+        estimate = estimate_conversion_time(metadata, format, jobs)
+        if estimate is not None:
+            log.info("Estimated conversion time: ~%.0fs", estimate)
         
+        start_time = time.perf_counter()
         # Process each dataset
-        converter = _get_converter(format, verbose)
-        for i, dataset in enumerate(datasets, 1):
-            repo_id = dataset['repo_id']
-            selected_videos = dataset['selected_videos']    
-            if verbose:
-                print(f"\n[{i}/{len(datasets)}] Converting dataset: {repo_id}")
-                print(f"Selected videos: {', '.join(selected_videos)}")
-            
-            result = converter.convert_dataset(repo_id, selected_videos, input_dir, output_dir)
-            
-            if result['status'] == 'error':
-                print(f"Conversion failed")
-            elif verbose:
-                if 'episodes_converted' in result:
-                    print(f"Converted {result['episodes_converted']} episodes")
-                    print(f"Output directory: {output_dir}")
+        results = [None] * len(datasets)
+
+        if jobs == 1:
+            converter = _get_converter(format, verbose, quantize, compression)
+            for i, dataset in enumerate(datasets, 1):
+                repo_id = dataset['repo_id']
+                selected_videos = dataset['selected_videos']
+                log.info("\n[%d/%d] Converting dataset: %s", i, len(datasets), repo_id)
+                log.info("Selected videos: %s", ', '.join(selected_videos))
+
+                try:
+                    result = converter.convert_dataset(repo_id, selected_videos, input_dir, output_dir)
+                except Exception as e:
+                    result = _error_result(repo_id, e)
+                results[i - 1] = result
+                _report_result(result, i, len(datasets), output_abs)
+        else:
+            log.info("Using %d parallel workers", jobs)
+            # This converter only runs finalize() and close(); datasets are converted by
+            # converters built inside each worker, so only plain arguments are pickled.
+            converter = _get_converter(format, verbose, quantize, compression)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                # Workers convert quietly: their verbose prints would interleave with each
+                # other, and per-dataset progress is logged here as results come in
+                futures = {
+                    executor.submit(
+                        _convert_one, format, False,
+                        dataset['repo_id'], dataset['selected_videos'],
+                        input_dir, output_dir, quantize, compression
+                    ): index
+                    for index, dataset in enumerate(datasets)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    repo_id = datasets[index]['repo_id']
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = _error_result(repo_id, e)
+                    results[index] = result
+                    _report_result(result, done, len(datasets), output_abs)
+
+        try:
+            converter.finalize(output_dir, results)
+        finally:
+            converter.close()
+
+        total_frames = metadata.get('total_frames')
+        if total_frames and all(result and result['status'] == 'success' for result in results):
+            _record_conversion_rate(format, total_frames, time.perf_counter() - start_time, jobs)
 
     except Exception as e:
         print(f"Error: Conversion failed: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def estimate_conversion_time(metadata: Mapping[str, Any], format: str, jobs: int = 1) -> Optional[float]:
+    """
+    Estimate how long converting a selection will take.
+    
+    Args:
+        metadata: The selection's 'metadata' object, containing 'total_frames'
+        format: Target conversion format
+        jobs: Number of parallel conversion workers
+        
+    Returns:
+        Estimated time in seconds, or None if the selection has no frame count
+    """
+    total_frames = metadata.get('total_frames')
+    if not total_frames:
+        return None
+    
+    fps = _get_profiled_fps().get(format, DEFAULT_FPS)
+    return total_frames / (fps * max(1, jobs))
+
+
+def _get_profiled_fps() -> Dict[str, float]:
+    """Load the measured per-format, per-worker conversion rates, once per process."""
+    global _PROFILED_FPS
+    if _PROFILED_FPS is None:
+        try:
+            profile = json.loads(PROFILE_PATH.read_text())
+            _PROFILED_FPS = {
+                key: float(value) for key, value in profile.items()
+                if isinstance(value, (int, float)) and value > 0
+            }
+        except (OSError, ValueError, AttributeError):
+            _PROFILED_FPS = {}
+    return _PROFILED_FPS
+
+
+def _record_conversion_rate(format: str, frames: int, elapsed: float, jobs: int = 1) -> None:
+    """Blend the per-worker conversion rate measured for a completed run into the stored profile."""
+    if elapsed < PROFILE_MIN_SECONDS or format not in _PROFILED_FORMATS:
+        return
+    
+    profile = dict(_get_profiled_fps())
+    fps = frames / (elapsed * max(1, jobs))
+    if format in profile:
+        fps = PROFILE_SMOOTHING * fps + (1 - PROFILE_SMOOTHING) * profile[format]
+    profile[format] = fps
+    try:
+        PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = PROFILE_PATH.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(profile, indent=2))
+        os.replace(tmp_path, PROFILE_PATH)
+    except OSError:
+        # The profile is only used for estimates, never fail a conversion over it
+        return
+    _PROFILED_FPS.update(profile)
+
+
+class _EchoHandler(logging.Handler):
+    """Log handler that prints to whatever sys.stdout is when the record is emitted."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _configure_logging(verbose: bool) -> None:
+    """Send conversion log messages to stdout, showing info messages only when verbose."""
+    if not log.handlers:
+        handler = _EchoHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+        log.propagate = False
+    log.setLevel(logging.INFO if verbose else logging.WARNING)
+
+
+def default_jobs() -> int:
+    """Get the default number of parallel conversion workers."""
+    return min(4, os.cpu_count() or 1)
+
+
+def _convert_one(
+    format: str,
+    verbose: bool,
+    repo_id: str,
+    selected_videos: List[str],
+    input_dir: Path,
+    output_dir: Path,
+    quantize: str = 'none',
+    compression: str = 'none'
+) -> Dict[str, Any]:
+    """Convert a single dataset inside a worker process."""
+    converter = _get_worker_converter(format, verbose, quantize, compression)
+    converter.reset()
+    return converter.convert_dataset(repo_id, selected_videos, input_dir, output_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_worker_converter(format: str, verbose: bool, quantize: str, compression: str):
+    """Get the converter of this worker process, built once and reused across datasets."""
+    return _get_converter(format, verbose, quantize, compression)
+
+
+def _error_result(repo_id: str, error: Exception) -> Dict[str, Any]:
+    """Build the result of a dataset whose conversion raised instead of returning a result."""
+    return {
+        'status': 'error',
+        'repo_id': repo_id,
+        'episodes_converted': 0,
+        'message': str(error),
+    }
+
+
+def _report_result(result: Dict[str, Any], done: int, total: int, output_dir: Path) -> None:
+    """Log the outcome of a single dataset conversion; failures are shown even when not verbose."""
+    repo_id = result.get('repo_id', '')
+    if result['status'] == 'error':
+        log.error("[%d/%d] ✗ %s: Conversion failed", done, total, repo_id)
+    else:
+        log.info("[%d/%d] ✓ %s", done, total, repo_id)
+        if 'episodes_converted' in result:
+            log.info("Converted %s episodes", result['episodes_converted'])
+            log.info("Output directory: %s", output_dir)
+
+
 def validate_output_path(output_path: str) -> Path:
     try:
         path = Path(output_path)
         
         # Check if parent directory is writable
         parent = path.parent
-        if not parent.exists():
+        try:
+            os.stat(parent)
+        except FileNotFoundError:
             print(f"Error: Parent directory does not exist: {parent}", file=sys.stderr)
             sys.exit(1)
         
@@ -88,11 +300,14 @@ def validate_input_path(input_path: str) -> Path:
     try:
         path = Path(input_path)
         
-        if not path.exists():
+        # A single stat() covers both the existence and the directory check
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             print(f"Error: Input directory does not exist: {input_path}", file=sys.stderr)
             sys.exit(1)
         
-        if not path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             print(f"Error: Input path is not a directory: {input_path}", file=sys.stderr)
             sys.exit(1)
         
@@ -109,28 +324,40 @@ def validate_input_path(input_path: str) -> Path:
 
 def get_supported_formats() -> List[str]:
     """Get all supported conversion formats (including those not yet available in CLI)."""
-    return ['droid', 'vjepa2-ac']
+    return sorted(_SUPPORTED_FORMATS)
 
 
 def validate_format(format: str) -> str:
     format_lower = format.lower()
-    supported = get_supported_formats()
     
-    if format_lower not in supported:
-        print(f"Error: Unsupported format '{format}'. Supported formats: {', '.join(supported)}", file=sys.stderr)
+    if format_lower not in _SUPPORTED_FORMATS:
+        print(f"Error: Unsupported format '{format}'. Supported formats: {', '.join(get_supported_formats())}", file=sys.stderr)
         sys.exit(1)
     
     return format_lower
 
 
+def validate_conversion_options(format: str, quantize: str, compression: str) -> None:
+    """Check that the quantize and compression options are supported by the validated format."""
+    if quantize != 'none' and format not in _QUANTIZABLE_FORMATS:
+        print(f"Error: Quantization is not supported for format: {format}", file=sys.stderr)
+        sys.exit(1)
+
+    if compression != 'none' and format not in _HDF5_FORMATS:
+        print(f"Error: Compression is not supported for format: {format}", file=sys.stderr)
+        sys.exit(1)
+
+
 
-def _get_converter(format: str, verbose: bool = False):
+def _get_converter(format: str, verbose: bool = False, quantize: str = 'none', compression: str = 'none'):
     """
     Factory function to get the appropriate converter based on format.
     
     Args:
-        format: Target conversion format ('droid' or 'vjepa2-ac')
+        format: Target conversion format ('droid', 'vjepa2-ac', 'droid-parquet' or 'vjepa2-ac-zarr')
         verbose: Whether to enable verbose logging
+        quantize: Storage quantization for state/action arrays ('none', 'bf16' or 'int8')
+        compression: HDF5 compression for trajectory files ('none' or 'blosc-lz4')
         
     Returns:
         Converter instance for the specified format
@@ -141,7 +368,14 @@ def _get_converter(format: str, verbose: bool = False):
     if format == 'droid':
         return DROIDConverter(verbose=verbose)
     elif format == 'vjepa2-ac':
-        return VJEPA2ACConverter(verbose=verbose)
+        return VJEPA2ACConverter(verbose=verbose, quantize=quantize, compression=compression)
+    elif format == 'droid-parquet':
+        # Optional backends are imported lazily so pyarrow/zarr are only needed when used
+        from .droid_parquet_conversion import DROIDParquetConverter
+        return DROIDParquetConverter(verbose=verbose)
+    elif format == 'vjepa2-ac-zarr':
+        from .vjepa2_ac_zarr_conversion import VJEPA2ACZarrConverter
+        return VJEPA2ACZarrConverter(verbose=verbose, quantize=quantize)
     else:
-        print(f"Error: Unsupported format: {format}. Supported formats: {get_supported_formats()}", file=sys.stderr)
+        print(f"Error: Unsupported format: {format}. Supported formats: {', '.join(get_supported_formats())}", file=sys.stderr)
         sys.exit(1) 
\ No newline at end of file
@@ -107,6 +107,22 @@ class DROIDConverter:
 
             return error_result
 
+    def finalize(self, output_dir: Path, results: List[Dict[str, Any]]) -> None:
+        """
+        Hook called once after all datasets have been converted.
+        
+        Args:
+            output_dir: Directory where the converted datasets were saved
+            results: Conversion results, one per dataset in selection order
+        """
+        # Each dataset is converted independently, nothing to combine
+
+    def reset(self) -> None:
+        """Clear per-run state; this converter keeps none."""
+
+    def close(self) -> None:
+        """Release resources held by the converter; this converter holds none."""
+
     def _process_video_stream(self, video_stream: str, input_dir: Path, output_file: Path):
         """
         Process a single video stream for DROID conversion.
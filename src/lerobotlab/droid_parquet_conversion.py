@@ -0,0 +1,235 @@
+"""
+LeRobotLab Tools - DROID Parquet Conversion Module
+
+Handles conversion of robot datasets to a columnar Parquet layout, one row group per episode.
+"""
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Check if pyarrow is installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    print("The droid-parquet format requires pyarrow.")
+    print('Please install it by running: "pip install lerobotlab[parquet]"')
+    sys.exit(1)
+
+
+# Maximum number of episodes loaded ahead of the one being written
+PREFETCH_DEPTH = 8
+
+
+class DROIDParquetConverter:
+    """
+    Converter class for transforming robot datasets to DROID-style Parquet files.
+
+    Every dataset becomes a single zstd-compressed Parquet file holding the
+    low-dimensional episode data, with one row group per episode. Episodes
+    are read and decoded on a thread pool since pyarrow releases the GIL.
+    """
+
+    def __init__(self, verbose: bool = False, max_workers: int = None):
+        """
+        Initialize the DROID Parquet converter.
+
+        Args:
+            verbose: Whether to enable verbose logging
+            max_workers: Number of threads used to load episodes (default: CPU count)
+        """
+        self.verbose = verbose
+        self.format_name = "DROID-PARQUET"
+        self.file_extension = ".parquet"
+        self.compression = "zstd"
+        self.compression_level = 3
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = None
+
+    def convert_dataset(
+        self,
+        repo_id: str,
+        selected_videos: List[str],
+        input_dir: Path,
+        output_dir: Path
+    ) -> Dict[str, Any]:
+        """
+        Convert a single dataset to DROID Parquet format.
+
+        Args:
+            repo_id: Repository ID of the dataset (e.g., 'username/dataset_name')
+            selected_videos: List of selected video streams to reference
+            input_dir: Directory containing the input dataset
+            output_dir: Directory where the converted file should be saved
+
+        Returns:
+            dict: Conversion result with status and metadata
+        """
+        username, foldername = repo_id.split('/')
+        input_path = Path(input_dir) / username / foldername
+        output_file = Path(output_dir) / f"{repo_id.replace('/', '+')}{self.file_extension}"
+
+        if self.verbose:
+            print(f"    Starting {self.format_name} conversion for: {repo_id}")
+            print(f"    Input directory: {input_path}")
+            print(f"    Output file: {output_file}")
+            print(f"    Selected videos: {', '.join(selected_videos)}")
+
+        try:
+            dataset_info = self.load_dataset_info(input_path)
+            episode_paths = [
+                input_path / self.get_episode_data_path(dataset_info, episode_index)
+                for episode_index in range(dataset_info["total_episodes"])
+            ]
+            episodes_converted = self.write_parquet(
+                episode_paths, output_file, repo_id, selected_videos
+            )
+
+            if self.verbose:
+                print(f"    ✓ Conversion completed: {episodes_converted} episodes written to {output_file}")
+
+            return {
+                'status': 'success',
+                'repo_id': repo_id,
+                'format': self.format_name,
+                'output_file': str(output_file),
+                'episodes_converted': episodes_converted,
+            }
+
+        except Exception as e:
+            if self.verbose:
+                print(f"    ✗ Conversion failed: {str(e)}")
+
+            return {
+                'status': 'error',
+                'repo_id': repo_id,
+                'format': self.format_name,
+                'output_file': str(output_file),
+                'episodes_converted': 0,
+                'message': f"Error converting {repo_id} to {self.format_name}: {str(e)}"
+            }
+
+    def write_parquet(
+        self,
+        episode_paths: List[Path],
+        output_file: Path,
+        repo_id: str,
+        selected_videos: List[str]
+    ) -> int:
+        """
+        Write all episodes to a single Parquet file, one row group per episode.
+
+        The file is written under a temporary name and only moved into place
+        once every episode has been written, so a failed dataset leaves no
+        partial output behind.
+
+        Args:
+            episode_paths: Paths of the LeRobot episode parquet files, in order
+            output_file: Path of the Parquet file to create
+            repo_id: Repository ID stored in the file metadata
+            selected_videos: Video streams stored in the file metadata
+
+        Returns:
+            int: Number of episodes written
+
+        Raises:
+            ValueError: If there are no episodes to write
+        """
+        if not episode_paths:
+            raise ValueError(f"No episodes found for {repo_id}")
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        executor = self._get_executor()
+        writer = None
+        episodes_written = 0
+
+        try:
+            # Reads run at most PREFETCH_DEPTH episodes ahead so loaded tables
+            # cannot pile up in memory when the writer is the slower stage
+            pending = deque()
+            remaining = iter(episode_paths)
+            while True:
+                for episode_path in remaining:
+                    pending.append(executor.submit(self.load_episode_table, episode_path))
+                    if len(pending) >= PREFETCH_DEPTH:
+                        break
+                if not pending:
+                    break
+
+                table = pending.popleft().result()
+                if writer is None:
+                    schema = table.schema.with_metadata({
+                        b'repo_id': repo_id.encode(),
+                        b'selected_videos': json.dumps(selected_videos).encode(),
+                    })
+                    writer = pq.ParquetWriter(
+                        tmp_file,
+                        schema,
+                        compression=self.compression,
+                        compression_level=self.compression_level,
+                    )
+                table = table.cast(writer.schema)
+                writer.write_table(table, row_group_size=max(1, table.num_rows))
+                episodes_written += 1
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        writer.close()
+        os.replace(tmp_file, output_file)
+        return episodes_written
+
+    def load_episode_table(self, episode_data_path: Path) -> "pa.Table":
+        """Load a single episode as an Arrow table"""
+        if not episode_data_path.exists():
+            raise FileNotFoundError(f"Episode file not found: {episode_data_path}")
+
+        return pq.read_table(episode_data_path).combine_chunks()
+
+    def load_dataset_info(self, dataset_path: Path) -> Dict:
+        """Load dataset info from meta/info.json"""
+        info_path = dataset_path / "meta" / "info.json"
+        if not info_path.exists():
+            raise FileNotFoundError(f"Dataset info file not found: {info_path}")
+
+        with open(info_path, 'r') as f:
+            return json.load(f)
+
+    def get_episode_data_path(self, metadata: Dict, episode_index: int) -> str:
+        """Get the relative episode data path from metadata"""
+        return metadata["data_path"].format(
+            episode_chunk=episode_index // metadata["chunks_size"],
+            episode_index=episode_index
+        )
+
+    def reset(self) -> None:
+        """Clear per-run state; this converter keeps none besides its thread pool"""
+
+    def close(self) -> None:
+        """Release the episode loading thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the episode loading thread pool, kept warm across datasets"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def finalize(self, output_dir: Path, results: List[Dict[str, Any]]) -> None:
+        """
+        Hook called once after all datasets have been converted.
+
+        Args:
+            output_dir: Directory where the converted datasets were saved
+            results: Conversion results, one per dataset in selection order
+        """
+        # Each dataset is a self-contained Parquet file, nothing to combine
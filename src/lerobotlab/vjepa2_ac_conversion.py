@@ -3,8 +3,14 @@ LeRobotLab Tools - V-JEPA2-AC Conversion Module
 
 Handles conversion of robot datasets to V-JEPA2-AC format for actor-critic training.
 """
+from collections import deque
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+import queue
+import threading
+import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 # Removed click dependency
 import json
 import pandas as pd
@@ -13,6 +19,208 @@ import h5py
 import numpy as np
 
 
+# Joint names of the SO-100/SO-101 arms, used for both actions and states
+JOINT_NAMES = [
+    "shoulder_pan.pos", "shoulder_lift.pos", "elbow_flex.pos",
+    "wrist_flex.pos", "wrist_roll.pos", "gripper.pos"
+]
+
+# Supported storage quantization modes for state/action arrays
+QUANTIZATION_MODES = ('none', 'bf16', 'int8')
+
+# On-disk dtype of quantized fields for each quantization mode
+QUANTIZED_DTYPES = {'none': 'float32', 'bf16': 'uint16', 'int8': 'uint8'}
+
+# Trajectory fields that are quantized when a quantization mode is selected
+QUANTIZED_FIELDS = ('action/data', 'observation/state')
+
+# Number of episode data files read ahead of the episode being converted
+PREFETCH_DEPTH = 8
+
+# Number of prepared episodes waiting for the writer thread
+WRITE_QUEUE_SIZE = 2
+
+# Seconds between checks that the writer thread is still alive while the write queue is full
+WRITE_QUEUE_TIMEOUT = 1.0
+
+# Supported HDF5 compression modes for trajectory.h5
+COMPRESSION_MODES = ('none', 'blosc-lz4')
+
+# Target size of a single HDF5 chunk, large enough for Blosc to split across its threads
+H5_CHUNK_BYTES = 1 << 20
+
+
+def _blosc_filter_options() -> Dict[str, Any]:
+    """
+    Get the create_dataset() filter options for Blosc+LZ4 with byte shuffle.
+
+    hdf5plugin is imported here rather than at module load, so it is only
+    needed when compression is requested.
+    """
+    try:
+        import hdf5plugin
+    except ImportError:
+        print("Blosc compression requires hdf5plugin.")
+        print('Please install it by running: "pip install lerobotlab[blosc]"')
+        sys.exit(1)
+    return dict(hdf5plugin.Blosc(cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+
+
+def _row_chunks(data: np.ndarray) -> Tuple[int, ...]:
+    """Get a chunk shape of whole rows, roughly H5_CHUNK_BYTES in size, for a non-empty array"""
+    row_bytes = max(1, data[:1].nbytes)
+    rows_per_chunk = max(1, min(len(data), H5_CHUNK_BYTES // row_bytes))
+    return (rows_per_chunk,) + data.shape[1:]
+
+
+def _h5_dataset_options(data: np.ndarray, filter_options: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Get create_dataset() keyword arguments for the selected compression.
+
+    Args:
+        data: Array that will be written
+        filter_options: HDF5 filter options, empty for no compression
+
+    Returns:
+        dict: Chunking and filter options, empty for uncompressed or row-less arrays
+    """
+    if not filter_options or data.ndim == 0 or len(data) == 0:
+        return {}
+
+    return {
+        'chunks': _row_chunks(data),
+        **filter_options,
+    }
+
+
+def _stack_rows(values: np.ndarray, dtype=np.float32, width: int = None) -> np.ndarray:
+    """
+    Stack a column of per-frame vectors into one (N, D) array.
+
+    The output buffer is preallocated so the rows are copied and cast in a
+    single pass instead of building an intermediate array first.
+
+    Args:
+        values: Object array holding one vector per frame
+        dtype: Output dtype
+        width: Row length D used when the column is empty (default: len(JOINT_NAMES))
+
+    Returns:
+        np.ndarray: Contiguous array of shape (N, D)
+    """
+    if len(values) == 0:
+        return np.empty((0, width or len(JOINT_NAMES)), dtype=dtype)
+
+    out = np.empty((len(values),) + np.shape(values[0]), dtype=dtype)
+    np.stack(values, out=out)
+    return out
+
+
+def _episode_columns(episode_data: pd.DataFrame, quantize: str = 'none') -> Dict[str, Tuple[np.ndarray, Dict[str, Any]]]:
+    """
+    Collect the trajectory fields of an episode as one contiguous array each.
+
+    Args:
+        episode_data: Episode frames loaded from the LeRobot parquet file
+        quantize: Storage quantization applied to QUANTIZED_FIELDS
+
+    Returns:
+        dict: (array, attributes) pairs keyed by their path in the trajectory file (e.g. 'action/data')
+    """
+    columns = {}
+    if 'action' in episode_data.columns:
+        columns['action/data'] = _stack_rows(episode_data['action'].values)
+    if 'observation.state' in episode_data.columns:
+        columns['observation/state'] = _stack_rows(episode_data['observation.state'].values)
+    if 'timestamp' in episode_data.columns:
+        columns['metadata/timestamp'] = np.ascontiguousarray(episode_data['timestamp'].values)
+    if 'frame_index' in episode_data.columns:
+        columns['metadata/frame_index'] = np.ascontiguousarray(episode_data['frame_index'].values)
+
+    return {
+        name: _quantize(data, quantize) if name in QUANTIZED_FIELDS else (data, {})
+        for name, data in columns.items()
+    }
+
+
+def _quantize(data: np.ndarray, mode: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Quantize a float32 (N, D) array for storage.
+
+    'int8' maps each channel linearly onto 256 levels, stored as uint8 codes
+    with x ~= code * scale + zero_point. 'bf16' keeps the upper 16 bits of each
+    float32 (round to nearest even), stored as uint16, with NaNs kept as NaN.
+
+    Args:
+        data: Array to quantize
+        mode: One of QUANTIZATION_MODES
+
+    Returns:
+        tuple: Quantized array and the attributes needed to decode it
+
+    Raises:
+        ValueError: If 'int8' is requested for data containing NaN or infinity
+    """
+    if mode == 'none' or len(data) == 0:
+        return data, {}
+
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    if mode == 'bf16':
+        bits = data.view(np.uint32)
+        rounded = bits + (np.uint32(0x7FFF) + ((bits >> 16) & np.uint32(1)))
+        # The rounding bias overflows for NaNs with a high mantissa, so store a quiet NaN instead
+        codes = np.where(np.isnan(data), np.uint16(0x7FC0), (rounded >> 16).astype(np.uint16))
+        return codes, {'quantization': 'bf16'}
+
+    if mode == 'int8':
+        if not np.isfinite(data).all():
+            raise ValueError("int8 quantization only supports finite values")
+        zero_point = data.min(axis=0)
+        scale = (data.max(axis=0) - zero_point) / np.float32(255)
+        # Constant channels would divide by zero, any scale decodes them exactly
+        scale[scale == 0] = 1
+        codes = np.round((data - zero_point) / scale).astype(np.uint8)
+        return codes, {'quantization': 'int8', 'scale': scale, 'zero_point': zero_point}
+
+    raise ValueError(f"Unsupported quantization mode: {mode}")
+
+
+@functools.lru_cache(maxsize=32)
+def _episode_path_builder(data_path: str, video_path: str, video_keys: Tuple[str, ...]):
+    """
+    Build a path function specialized for one dataset layout and video selection.
+
+    The video keys are substituted into the video path template once, so each
+    episode only formats its chunk and index.
+
+    Args:
+        data_path: Episode data path template from meta/info.json
+        video_path: Episode video path template from meta/info.json
+        video_keys: Selected video streams
+
+    Returns:
+        Callable taking (episode_chunk, episode_index) and returning the episode paths
+    """
+    video_templates = tuple(
+        (key, video_path.replace('{video_key}', key.replace('{', '{{').replace('}', '}}')))
+        for key in video_keys
+    )
+
+    def build(episode_chunk: int, episode_index: int) -> Dict:
+        return {
+            "data": data_path.format(episode_chunk=episode_chunk, episode_index=episode_index),
+            "videos": {
+                key: {
+                    "key": key,
+                    "path": template.format(episode_chunk=episode_chunk, episode_index=episode_index)
+                }
+                for key, template in video_templates
+            }
+        }
+
+    return build
+
+
 class VJEPA2ACConverter:
     """
     Converter class for transforming robot datasets to V-JEPA2-AC format.
@@ -21,17 +229,29 @@ class VJEPA2ACConverter:
     is designed for vision-based robotic learning with temporal prediction.
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, quantize: str = 'none', compression: str = 'none'):
         """
         Initialize the V-JEPA2-AC converter.
         
         Args:
             verbose: Whether to enable verbose logging
+            quantize: Storage quantization for state/action arrays ('none', 'bf16' or 'int8')
+            compression: HDF5 compression for trajectory.h5 ('none' or 'blosc-lz4')
         """
+        if quantize not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization mode: {quantize}")
+        if compression not in COMPRESSION_MODES:
+            raise ValueError(f"Unsupported compression mode: {compression}")
         self.verbose = verbose
+        self.quantize = quantize
+        self.compression = compression
+        # Filter options are built once and shared by every dataset write
+        self._h5_filter = _blosc_filter_options() if compression == 'blosc-lz4' else {}
         self.format_name = "V-JEPA2-AC"
-        self.converted_episode_paths = []
-        self.total_converted_episodes = 0
+        self.trajectory_filename = "trajectory.h5"
+        self._executor = None
+        # Serializes episode progress output from the prepare and writer threads
+        self._print_lock = threading.Lock()
         
     def convert_dataset(
         self,
@@ -80,30 +300,60 @@ class VJEPA2ACConverter:
        
 
         try:
-            for episode_index in range(dataset_info["total_episodes"]):
-                episode_paths = self.get_episode_paths(dataset_info, selected_videos, episode_index)
-                print(f"Processing episode {episode_index}")
-                episode_dir_name = self.convert_episode_to_vjepa2_ac(input_path,episode_index,episode_paths, repo_id, video_key, episodes_dir)
-                converted_episode_path = f"episodes/{episode_dir_name}"               
-                if episode_dir_name:            
-                    self.converted_episode_paths.append(converted_episode_path)
-                self.total_converted_episodes += 1
-
-            # Create dataset_list.txt - single file with all episodes
-            dataset_list_path = output_dir / "dataset_list.txt"
-            with open(dataset_list_path, 'w') as f:
-                for episode_path in self.converted_episode_paths:
-                    f.write(f"{episode_path}\n")
-            
+            dataset_episode_paths = []
+            episodes_converted = 0
+            total_episodes = dataset_info["total_episodes"]
+            # Episodes flow through three stages: episode data files are read ahead on a
+            # thread pool, arrays are prepared here, and a writer thread writes the output.
+            # The bounded write queue keeps preparation at most a few episodes ahead.
+            # Stages share one process, so prepared arrays are handed over by reference, never copied.
+            executor = self._get_executor()
+            write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            written = []
+            writer_errors = []
+            writer = threading.Thread(
+                target=self._episode_writer, args=(write_queue, episodes_dir, written, writer_errors), daemon=True
+            )
+            writer.start()
+            try:
+                pending = deque()
+                next_index = 0
+                while next_index < total_episodes or pending:
+                    while next_index < total_episodes and len(pending) < PREFETCH_DEPTH:
+                        next_paths = self.get_episode_paths(dataset_info, selected_videos, next_index)
+                        next_data = executor.submit(
+                            self.load_episode_data, input_path / next_paths["data"], next_index
+                        )
+                        pending.append((next_index, next_paths, next_data))
+                        next_index += 1
+
+                    episode_index, episode_paths, episode_data = pending.popleft()
+                    self._print(f"Processing episode {episode_index}")
+                    prepared = self.prepare_episode(input_path, episode_index, episode_paths, repo_id, video_key, episode_data)
+                    if prepared is not None:
+                        self._enqueue(write_queue, writer, prepared, writer_errors)
+                    episodes_converted += 1
+            finally:
+                if writer.is_alive():
+                    self._enqueue(write_queue, writer, None, writer_errors)
+                writer.join()
+
+            if writer_errors:
+                raise RuntimeError(f"Episode writer failed: {writer_errors[0]}")
+
+            for episode_dir_name in written:
+                dataset_episode_paths.append(f"episodes/{episode_dir_name}")
+
+            # dataset_list.txt is written once by finalize(), after every dataset is done
             if self.verbose:
                 print(f"Conversion complete!")
-                print(f"Dataset list saved to: {dataset_list_path}")
 
 
             conversion_result = {
                 'status': 'success',
                 'repo_id': repo_id,
-                'episodes_converted': self.total_converted_episodes,
+                'episodes_converted': episodes_converted,
+                'episode_paths': dataset_episode_paths,
             }  
 
             return conversion_result                
@@ -117,6 +367,50 @@ class VJEPA2ACConverter:
             return error_result
         
     
+    def reset(self) -> None:
+        """Clear per-run state; this converter keeps none besides its thread pool"""
+
+    def close(self) -> None:
+        """Release the episode prefetch thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the episode prefetch thread pool, kept warm across datasets"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=PREFETCH_DEPTH)
+        return self._executor
+
+    def write_dataset_list(self, output_dir: Path, episode_paths: List[str]) -> Path:
+        """Write dataset_list.txt listing every converted episode"""
+        dataset_list_path = output_dir / "dataset_list.txt"
+        with open(dataset_list_path, 'w') as f:
+            for episode_path in episode_paths:
+                f.write(f"{episode_path}\n")
+        return dataset_list_path
+
+    def finalize(self, output_dir: Path, results: List[Dict[str, Any]]) -> None:
+        """
+        Write dataset_list.txt, a single file with all episodes, once all datasets are converted.
+
+        This is the only writer of the list: datasets converted in separate worker
+        processes each only know their own episodes, so it is built here in
+        selection order.
+
+        Args:
+            output_dir: Directory where the converted datasets were saved
+            results: Conversion results, one per dataset in selection order
+        """
+        episode_paths = []
+        for result in results:
+            if result and result.get('status') == 'success':
+                episode_paths.extend(result.get('episode_paths', []))
+        dataset_list_path = self.write_dataset_list(output_dir, episode_paths)
+
+        if self.verbose:
+            print(f"Dataset list saved to: {dataset_list_path}")
+
     def load_dataset_info(self, dataset_path: Path) -> Dict:
         """Load dataset info from meta/info.json"""
         info_path = dataset_path / "meta" / "info.json"
@@ -129,27 +423,8 @@ class VJEPA2ACConverter:
     def get_episode_paths(self, metadata: Dict, video_keys: List[str], episode_index: int) -> Dict:
         """Get episode paths from metadata"""
         episode_chunk = episode_index // metadata["chunks_size"]
-
-        data_path = metadata["data_path"].format(
-            episode_chunk=episode_chunk,
-            episode_index=episode_index
-        )
-
-        video_paths = {
-            key: {
-                "key": key,
-                "path": metadata["video_path"].format(
-                    episode_chunk=episode_chunk,
-                    video_key=key,
-                    episode_index=episode_index
-                )
-            }
-            for key in video_keys
-        }
-        return {
-            "data": data_path,
-            "videos": video_paths
-        }
+        build = _episode_path_builder(metadata["data_path"], metadata["video_path"], tuple(video_keys))
+        return build(episode_chunk, episode_index)
 
     def load_episode_data(self, episode_data_path: Path, episode_idx: int) -> pd.DataFrame:
         """Load episode data from parquet file"""
@@ -158,24 +433,54 @@ class VJEPA2ACConverter:
 
         return pd.read_parquet(episode_data_path)
 
-    def convert_episode_to_vjepa2_ac(self, input_path: Path, episode_idx: int, episode_paths: Dict, repo_id: str, video_key: str, episode_output_dir: Path):
-        """Convert a single episode to VJEPA2-AC format"""
+    def convert_episode_to_vjepa2_ac(self, input_path: Path, episode_idx: int, episode_paths: Dict, repo_id: str, video_key: str, episode_output_dir: Path, prefetched_data: Optional[Future] = None):
+        """Convert a single episode to VJEPA2-AC format, optionally from already prefetched episode data"""
+        prepared = self.prepare_episode(input_path, episode_idx, episode_paths, repo_id, video_key, prefetched_data)
+        if prepared is None:
+            return None
+        return self.write_episode(prepared, episode_output_dir)
+
+    def prepare_episode(self, input_path: Path, episode_idx: int, episode_paths: Dict, repo_id: str, video_key: str, prefetched_data: Optional[Future] = None) -> Optional[Dict]:
+        """Load an episode and build everything needed to write it, without touching the output directory"""
         try:
             #dataset info
             converted_dataset_dir_name = repo_id.replace('/', '+')
-            episode_data_path = input_path / episode_paths["data"]
-            episode_data = self.load_episode_data(episode_data_path, episode_idx)
+            if prefetched_data is not None:
+                episode_data = prefetched_data.result()
+            else:
+                episode_data_path = input_path / episode_paths["data"]
+                episode_data = self.load_episode_data(episode_data_path, episode_idx)
             
             # Find corresponding video file
             video_path = input_path / episode_paths["videos"][video_key]["path"]
             original_dataset = repo_id
             
             if not video_path.exists():
-                print(f"Warning: Video file not found: {video_path}")
+                self._print(f"Warning: Video file not found: {video_path}")
                 return None
             
-            # Create episode directory with dataset name prefix
             episode_dir_name = f"{converted_dataset_dir_name}-episode_{episode_idx:03d}"
+            metadata = self.create_episode_metadata(episode_idx, episode_data,
+                                                Path(self.trajectory_filename), converted_dataset_dir_name, input_path, original_dataset)
+            
+            return {
+                "episode_idx": episode_idx,
+                "episode_dir_name": episode_dir_name,
+                "video_path": video_path,
+                "columns": _episode_columns(episode_data, self.quantize),
+                "metadata": metadata,
+            }
+            
+        except Exception as e:
+            self._print(f"Error processing episode {episode_idx}: {e}")
+            return None
+
+    def write_episode(self, prepared: Dict, episode_output_dir: Path) -> Optional[str]:
+        """Write a prepared episode: video, trajectory file and metadata.json"""
+        episode_idx = prepared["episode_idx"]
+        episode_dir_name = prepared["episode_dir_name"]
+        try:
+            # Create episode directory with dataset name prefix
             episode_dir = episode_output_dir / episode_dir_name
             episode_dir.mkdir(exist_ok=True)
             
@@ -185,28 +490,56 @@ class VJEPA2ACConverter:
             
             # Copy video file
             output_video_path = recordings_dir / "video.mp4"
-            shutil.copy2(video_path, output_video_path)
+            shutil.copy2(prepared["video_path"], output_video_path)
             
-            # Create trajectory.h5
-            trajectory_path = episode_dir / "trajectory.h5"
-            self.create_trajectory_h5(episode_data, trajectory_path)
+            # Create trajectory file
+            trajectory_path = episode_dir / self.trajectory_filename
+            self.create_trajectory(prepared["columns"], trajectory_path)
             
             # Create metadata.json
-            metadata = self.create_episode_metadata(episode_idx, episode_data,
-                                                trajectory_path, converted_dataset_dir_name, input_path, original_dataset)
             metadata_path = episode_dir / "metadata.json"
             with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+                json.dump(prepared["metadata"], f, indent=2)
             
             if self.verbose:
-                print(f"=> Created {episode_dir_name} with {len(episode_data)} frames")
+                self._print(f"=> Created {episode_dir_name} with {prepared['metadata']['total_frames']} frames")
             
         except Exception as e:
-            print(f"Error processing episode {episode_idx}: {e}")
+            self._print(f"Error processing episode {episode_idx}: {e}")
             return None
         
         return episode_dir_name
 
+    def _episode_writer(self, write_queue: queue.Queue, episode_output_dir: Path, written: List[str], errors: List[Exception]):
+        """Writer thread: write prepared episodes in order until a None sentinel arrives"""
+        try:
+            while True:
+                prepared = write_queue.get()
+                if prepared is None:
+                    return
+                episode_dir_name = self.write_episode(prepared, episode_output_dir)
+                if episode_dir_name:
+                    written.append(episode_dir_name)
+        except Exception as e:
+            errors.append(e)
+
+    def _enqueue(self, write_queue: queue.Queue, writer: threading.Thread, item: Optional[Dict], errors: List[Exception]):
+        """Put an item on the write queue, failing instead of blocking forever if the writer has stopped"""
+        while True:
+            if not writer.is_alive():
+                reason = errors[0] if errors else "stopped unexpectedly"
+                raise RuntimeError(f"Episode writer failed: {reason}")
+            try:
+                write_queue.put(item, timeout=WRITE_QUEUE_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def _print(self, message: str):
+        """Print a whole line without interleaving with the other pipeline thread"""
+        with self._print_lock:
+            print(message, flush=True)
+
 
 
     def create_episode_metadata(self, episode_idx: int, episode_data: pd.DataFrame,
@@ -228,7 +561,7 @@ class VJEPA2ACConverter:
             "data_keys": {
                 "action": {
                     "shape": [6],
-                    "dtype": "float32",
+                    "dtype": QUANTIZED_DTYPES[self.quantize],
                     "names": [
                         "shoulder_pan.pos", "shoulder_lift.pos", "elbow_flex.pos",
                         "wrist_flex.pos", "wrist_roll.pos", "gripper.pos"
@@ -236,58 +569,44 @@ class VJEPA2ACConverter:
                 },
                 "observation.state": {
                     "shape": [6],
-                    "dtype": "float32", 
+                    "dtype": QUANTIZED_DTYPES[self.quantize],
                     "names": [
                         "shoulder_pan.pos", "shoulder_lift.pos", "elbow_flex.pos",
                         "wrist_flex.pos", "wrist_roll.pos", "gripper.pos"
                     ]
                 }
             },
+            "quantization": self.quantize,
             "task": "n/a"  # Based on the dataset
         }
         return metadata
 
-    def create_trajectory_h5(self, episode_data: pd.DataFrame, output_path: Path):
-        """Convert episode data to HDF5 trajectory format"""
+    def create_trajectory(self, columns: Dict[str, Tuple[np.ndarray, Dict[str, Any]]], output_path: Path):
+        """Write episode trajectory columns, HDF5 by default"""
+        self.create_trajectory_h5(columns, output_path)
+
+    def create_trajectory_h5(self, columns: Dict[str, Tuple[np.ndarray, Dict[str, Any]]], output_path: Path):
+        """Write episode trajectory columns (see _episode_columns) to HDF5 trajectory format"""
         with h5py.File(output_path, 'w') as f:
             # Create groups for different data types
             action_group = f.create_group('action')
             observation_group = f.create_group('observation')
-            metadata_group = f.create_group('metadata')
+            f.create_group('metadata')
 
-            # Save action data
-            if 'action' in episode_data.columns:
-                action_data = np.stack(episode_data['action'].values)
-                action_group.create_dataset('data', data=action_data)
-                
-                # Add action names if available
-                action_names = [
-                    "shoulder_pan.pos", "shoulder_lift.pos", "elbow_flex.pos",
-                    "wrist_flex.pos", "wrist_roll.pos", "gripper.pos"
-                ]
-                action_group.attrs['names'] = action_names
-
-            # Save observation state data
-            if 'observation.state' in episode_data.columns:
-                obs_data = np.stack(episode_data['observation.state'].values)
-                observation_group.create_dataset('state', data=obs_data)
-                
-                # Add state names
-                state_names = [
-                    "shoulder_pan.pos", "shoulder_lift.pos", "elbow_flex.pos",
-                    "wrist_flex.pos", "wrist_roll.pos", "gripper.pos"
-                ]
-                observation_group.attrs['state_names'] = state_names
-
-            # Save timestamps
-            if 'timestamp' in episode_data.columns:
-                timestamps = episode_data['timestamp'].values
-                metadata_group.create_dataset('timestamp', data=timestamps)
-
-            # Save frame indices
-            if 'frame_index' in episode_data.columns:
-                frame_indices = episode_data['frame_index'].values
-                metadata_group.create_dataset('frame_index', data=frame_indices)
+            if self.compression != 'none':
+                # Blosc is an external HDF5 filter, readers must import hdf5plugin first
+                f.attrs['compression'] = self.compression
+                f.attrs['requires'] = 'hdf5plugin'
+
+            # One contiguous write per field
+            for name, (data, attrs) in columns.items():
+                dataset = f.create_dataset(name, data=data, **_h5_dataset_options(data, self._h5_filter))
+                dataset.attrs.update(attrs)
+
+            if 'action/data' in columns:
+                action_group.attrs['names'] = JOINT_NAMES
+            if 'observation/state' in columns:
+                observation_group.attrs['state_names'] = JOINT_NAMES
 
 
     def validate_input(self, input_dir: Path, selected_videos: List[str]) -> bool:
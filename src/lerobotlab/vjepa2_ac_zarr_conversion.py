@@ -0,0 +1,73 @@
+"""
+LeRobotLab Tools - V-JEPA2-AC Zarr Conversion Module
+
+Handles conversion of robot datasets to V-JEPA2-AC format with Zarr trajectory stores.
+"""
+import sys
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from .vjepa2_ac_conversion import VJEPA2ACConverter, JOINT_NAMES, _row_chunks
+
+# Check if zarr is installed
+try:
+    import numcodecs
+    import zarr
+except ImportError:
+    print("The vjepa2-ac-zarr format requires zarr and numcodecs.")
+    print('Please install them by running: "pip install lerobotlab[zarr]"')
+    sys.exit(1)
+
+
+# Shared across converter instances so the codec is only configured once per process
+_BLOSC_LZ4 = numcodecs.Blosc(cname='lz4', clevel=5, shuffle=numcodecs.Blosc.SHUFFLE)
+
+
+class VJEPA2ACZarrConverter(VJEPA2ACConverter):
+    """
+    Converter class for transforming robot datasets to V-JEPA2-AC format,
+    storing each episode trajectory as a Zarr group instead of HDF5.
+
+    Zarr chunks are compressed independently and without holding the GIL,
+    so trajectory writes are not serialized the way h5py writes are.
+    """
+
+    def __init__(self, verbose: bool = False, quantize: str = 'none'):
+        """
+        Initialize the V-JEPA2-AC Zarr converter.
+
+        Args:
+            verbose: Whether to enable verbose logging
+            quantize: Storage quantization for state/action arrays ('none', 'bf16' or 'int8')
+        """
+        super().__init__(verbose=verbose, quantize=quantize)
+        self.format_name = "V-JEPA2-AC-ZARR"
+        self.trajectory_filename = "trajectory.zarr"
+        self.compressor = _BLOSC_LZ4
+
+    def create_trajectory(self, columns: Dict[str, Tuple[np.ndarray, Dict[str, Any]]], output_path: Path):
+        """Write episode trajectory columns (see _episode_columns) to a Zarr trajectory store"""
+        root = zarr.open_group(str(output_path), mode='w')
+        action_group = root.create_group('action')
+        observation_group = root.create_group('observation')
+        root.create_group('metadata')
+
+        # One contiguous write per field
+        for name, (data, attrs) in columns.items():
+            self._write_array(root, name, data)
+            # Zarr attributes are JSON, so per-channel arrays are stored as lists
+            root[name].attrs.update({key: np.asarray(value).tolist() for key, value in attrs.items()})
+
+        if 'action/data' in columns:
+            action_group.attrs['names'] = JOINT_NAMES
+        if 'observation/state' in columns:
+            observation_group.attrs['state_names'] = JOINT_NAMES
+
+    def _write_array(self, group, name: str, data: np.ndarray):
+        """Write a single array into a Zarr group with Blosc+LZ4 compression, creating intermediate groups as needed"""
+        if len(data) == 0:
+            group.create_dataset(name, data=data)
+            return
+        group.create_dataset(name, data=data, chunks=_row_chunks(data), compressor=self.compressor)
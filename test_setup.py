@@ -10,6 +10,11 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Test selections
 SINGLE_DATASET = {
@@ -76,6 +81,15 @@ TEST_CASES = [
 ]
 
 
+def write_json(path, data):
+    """Write data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
 def create_test_structure():
     """Create test folder structure and JSON files."""
     
@@ -101,11 +115,8 @@ def create_test_structure():
     single_json = test_folder / "single_dataset.json"
     multi_json = test_folder / "multi_datasets.json"
     
-    with open(single_json, 'w', encoding='utf-8') as f:
-        json.dump(SINGLE_DATASET, f, indent=2)
-    
-    with open(multi_json, 'w', encoding='utf-8') as f:
-        json.dump(MULTI_DATASETS, f, indent=2)
+    write_json(single_json, SINGLE_DATASET)
+    write_json(multi_json, MULTI_DATASETS)
     
     print(f"✓ Created: {single_json}")
     print(f"✓ Created: {multi_json}")